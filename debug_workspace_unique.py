@@ -10,6 +10,9 @@ import os
 project_root = os.path.dirname(__file__)
 sys.path.insert(0, project_root)
 
+# Buffer console output and flush once per step instead of on every line
+sys.stdout.reconfigure(line_buffering=False)
+
 # Now import from the full path
 from src.main.services.agent.tools.workspaces import (
     get_workspace_stats, 
@@ -18,6 +21,10 @@ from src.main.services.agent.tools.workspaces import (
     list_workspaces
 )
 
+def end_section():
+    """Flush the buffered output for the current step"""
+    sys.stdout.flush()
+
 def debug_workspace_issue():
     """Debug the UNIQUE constraint issue"""
     
@@ -44,12 +51,14 @@ def debug_workspace_issue():
             if workspaces_result['status'] == 'success':
                 for ws in workspaces_result['workspaces']:
                     print(f"     - ID: {ws['id']}, Name: '{ws['name']}', Programs: {ws['programs']}, Links: {ws['links']}")
+    end_section()
     
     # Step 2: Clear database completely
     print("\n2. Clearing all workspaces...")
     clear_result = clear_all_workspaces()
     print(f"   Status: {clear_result['status']}")
     print(f"   Message: {clear_result['message']}")
+    end_section()
     
     # Step 3: Verify empty state
     print("\n3. Verifying database is empty...")
@@ -61,7 +70,9 @@ def debug_workspace_issue():
             print("   ✓ Database successfully cleared")
         else:
             print("   ✗ Database still has workspaces!")
+            end_section()
             return False
+    end_section()
     
     # Step 4: Test creating a workspace with a specific name
     print("\n4. Testing workspace creation...")
@@ -94,8 +105,10 @@ def debug_workspace_issue():
             print("   ✓ UNIQUE constraint error working as expected")
         else:
             print("   ✗ Unexpected result for duplicate creation")
+        end_section()
     else:
         print(f"   ✗ Failed to create test workspace: {create_result['message']}")
+        end_section()
         return False
     
     # Step 6: Final cleanup
@@ -106,13 +119,14 @@ def debug_workspace_issue():
     
     print("\n=== Debug Session Complete ===")
     print("\nSUMMARY:")
-    print("- Fresh database connections are now used for each operation")
+    print("- Each thread reuses one database connection; every operation still commits on its own")
     print("- Added clear_all_workspaces() and get_workspace_stats() for debugging") 
     print("- UNIQUE constraint errors should only occur when trying to create")
     print("  workspaces with names that already exist in the database")
     print("\nIf you're still getting UNIQUE constraint errors after clearing,")
     print("it means the workspace name you're trying to create already exists.")
     print("Use get_workspace_stats() to see what's in your database.")
+    end_section()
     
     return True
 
@@ -5,7 +5,7 @@ Simple, efficient memory storage with confidence scores
 """
 
 import sqlite3
-import json
+import orjson
 import os
 import platform
 import subprocess
@@ -14,6 +14,21 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+def _dumps(value: Any) -> str:
+    """Serialize a value for a JSON text column"""
+    # Non-string keys are stringified like the stdlib json module does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# Columns selected by every workspace query, decoded by _workspace_from_row
+_WORKSPACE_COLUMNS = "id, name, description, programs, links, created_at, last_used, usage_count"
+
+def _workspace_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a workspaces row into a dict with its JSON columns decoded"""
+    workspace = dict(row)
+    workspace['programs'] = orjson.loads(workspace['programs'])
+    workspace['links'] = orjson.loads(workspace['links']) if workspace['links'] else []
+    return workspace
+
 class MemoryDatabase:
     """SQLite-based memory storage with confidence scoring - Singleton Pattern"""
     
@@ -44,6 +59,8 @@ class MemoryDatabase:
                 db_path = str(project_root / "assets" / "data" / "luna_memory.db")
             
             self.db_path = db_path
+            # Connections are reused per thread; sqlite3 connections must stay on the thread that opened them
+            self._local = threading.local()
             self._init_database()
             self._initialized = True
     
@@ -52,11 +69,25 @@ class MemoryDatabase:
         """Get the singleton instance explicitly"""
         return cls(db_path)
     
+    def get_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection to the memory database, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # In WAL mode NORMAL only syncs at checkpoints and is still safe against application crashes
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
     def _init_database(self):
         """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # Write-ahead logging: readers don't block the writer and commits append instead of rewriting pages
+            # (persisted in the database file, so it only needs to be set once)
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Create memories table - simple 4 column structure
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS memories (
@@ -112,7 +143,7 @@ class MemoryDatabase:
     
     def add_memory(self, memory: str, confidence: float = 0.5) -> int:
         """Add a new memory to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -125,9 +156,9 @@ class MemoryDatabase:
     
     def get_memories(self, min_confidence: float = 0.0, limit: int = None) -> List[Dict[str, Any]]:
         """Retrieve memories above confidence threshold"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             query = """
                 SELECT id, memory, confidence, last_updated
@@ -149,7 +180,7 @@ class MemoryDatabase:
     
     def reinforce_memory(self, memory_id: int, factor: float = 0.1):
         """Reinforce a memory by increasing its confidence"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT confidence FROM memories WHERE id = ?", (memory_id,))
@@ -172,7 +203,7 @@ class MemoryDatabase:
     
     def weaken_memory(self, memory_id: int, factor: float = 0.2, auto_cleanup_threshold: float = 0.1):
         """Weaken a memory by decreasing its confidence and auto-cleanup if below threshold"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT confidence FROM memories WHERE id = ?", (memory_id,))
@@ -200,9 +231,9 @@ class MemoryDatabase:
     
     def search_similar_memories(self, query: str, min_confidence: float = 0.3) -> List[Dict[str, Any]]:
         """Simple text-based similarity search (will be enhanced later)"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             # Simple keyword matching for now
             search_terms = query.lower().split()
@@ -225,7 +256,7 @@ class MemoryDatabase:
     
     def cleanup_low_confidence_memories(self, threshold: float = 0.1):
         """Remove memories below confidence threshold"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM memories WHERE confidence < ?", (threshold,))
@@ -236,11 +267,11 @@ class MemoryDatabase:
     
     def log_tool_execution(self, tool_name: str, tool_arguments: Any = None, tool_result: Any = None, context: str = None, timestamp: datetime = None):
         """Log a tool execution to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            arguments_json = json.dumps(tool_arguments) if tool_arguments is not None else None
-            result_json = json.dumps(tool_result) if tool_result is not None else None
+            arguments_json = _dumps(tool_arguments) if tool_arguments is not None else None
+            result_json = _dumps(tool_result) if tool_result is not None else None
             
             if timestamp:
                 # Use custom timestamp in ISO format
@@ -259,9 +290,9 @@ class MemoryDatabase:
     
     def get_tool_executions(self, tool_name: str = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Retrieve tool executions from the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             if tool_name:
                 cursor.execute("""
@@ -281,16 +312,16 @@ class MemoryDatabase:
             for row in cursor.fetchall():
                 record = dict(row)
                 if record['arguments']:
-                    record['arguments'] = json.loads(record['arguments'])
+                    record['arguments'] = orjson.loads(record['arguments'])
                 if record.get('result'):
-                    record['result'] = json.loads(record['result'])
+                    record['result'] = orjson.loads(record['result'])
                 results.append(record)
             
             return results
     
     def update_memory_content(self, memory_id: int, new_text: str) -> bool:
         """Update memory text"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -304,7 +335,7 @@ class MemoryDatabase:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             # Memory stats
@@ -325,7 +356,7 @@ class MemoryDatabase:
     
     def clear_all_data(self):
         """Clear all data from the database for testing purposes and reset ID counters"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM memories")
             cursor.execute("DELETE FROM tool_executions")
@@ -341,11 +372,11 @@ class MemoryDatabase:
     
     def add_workspace(self, name: str, programs: List[str], description: str = None, links: List[str] = None) -> int:
         """Add a new workspace to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            programs_json = json.dumps(programs)
-            links_json = json.dumps(links if links else [])
+            programs_json = _dumps(programs)
+            links_json = _dumps(links if links else [])
             
             cursor.execute("""
                 INSERT INTO workspaces (name, description, programs, links)
@@ -357,12 +388,12 @@ class MemoryDatabase:
     
     def get_workspaces(self, limit: int = None) -> List[Dict[str, Any]]:
         """Retrieve all workspaces, ordered by last used"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
-            query = """
-                SELECT id, name, description, programs, links, created_at, last_used, usage_count
+            query = f"""
+                SELECT {_WORKSPACE_COLUMNS}
                 FROM workspaces 
                 ORDER BY last_used DESC
             """
@@ -372,38 +403,26 @@ class MemoryDatabase:
             
             cursor.execute(query)
             
-            workspaces = []
-            for row in cursor.fetchall():
-                workspace = dict(row)
-                workspace['programs'] = json.loads(workspace['programs'])
-                workspace['links'] = json.loads(workspace['links']) if workspace['links'] else []
-                workspaces.append(workspace)
-            
-            return workspaces
+            return [_workspace_from_row(row) for row in cursor.fetchall()]
     
     def get_workspace_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a workspace by name"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
-            cursor.execute("""
-                SELECT id, name, description, programs, links, created_at, last_used, usage_count
+            cursor.execute(f"""
+                SELECT {_WORKSPACE_COLUMNS}
                 FROM workspaces 
                 WHERE name = ?
             """, (name,))
             
             row = cursor.fetchone()
-            if row:
-                workspace = dict(row)
-                workspace['programs'] = json.loads(workspace['programs'])
-                workspace['links'] = json.loads(workspace['links']) if workspace['links'] else []
-                return workspace
-            return None
+            return _workspace_from_row(row) if row else None
     
     def update_workspace_usage(self, workspace_id: int):
         """Update workspace last used time and increment usage count"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -417,7 +436,7 @@ class MemoryDatabase:
     
     def delete_workspace(self, workspace_id: int) -> bool:
         """Delete a workspace by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM workspaces WHERE id = ?", (workspace_id,))
@@ -426,9 +445,9 @@ class MemoryDatabase:
     
     def search_workspaces(self, query: str) -> List[Dict[str, Any]]:
         """Search workspaces by name, description, programs, or links"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             search_terms = query.lower().split()
             like_conditions = " OR ".join([
@@ -440,18 +459,11 @@ class MemoryDatabase:
                 like_params.extend([f"%{term}%", f"%{term}%", f"%{term}%", f"%{term}%"])
             
             cursor.execute(f"""
-                SELECT id, name, description, programs, links, created_at, last_used, usage_count
+                SELECT {_WORKSPACE_COLUMNS}
                 FROM workspaces 
                 WHERE {like_conditions}
                 ORDER BY usage_count DESC, last_used DESC
                 LIMIT 10
             """, like_params)
             
-            workspaces = []
-            for row in cursor.fetchall():
-                workspace = dict(row)
-                workspace['programs'] = json.loads(workspace['programs'])
-                workspace['links'] = json.loads(workspace['links']) if workspace['links'] else []
-                workspaces.append(workspace)
-            
-            return workspaces
+            return [_workspace_from_row(row) for row in cursor.fetchall()]
@@ -7,6 +7,7 @@ Uses Gemini to analyze raw patterns and extract actionable insights
 import json
 import os
 import asyncio
+import time
 from typing import Dict, List, Any
 
 import sys
@@ -20,9 +21,18 @@ from .memory_database import MemoryDatabase
 # Load analyzer environment BEFORE importing google.genai to avoid API key warnings
 load_env('analyzer')
 
-from google.genai import Client
+import httpx
+from google.genai import Client, errors
 from google.genai.types import GenerateContentConfig
 
+# Circuit breaker: after this many consecutive failed Gemini calls, skip them for the cooldown period.
+# Failures are only reset by a successful call, so the first call after a cooldown is a probe that
+# re-opens the breaker if it fails.
+FAILURE_THRESHOLD = 3
+FAILURE_COOLDOWN_SECONDS = 30.0
+# Errors meaning Gemini could not be reached or could not answer; request and parsing errors don't count
+UNAVAILABLE_ERRORS = (asyncio.TimeoutError, OSError, httpx.TransportError, errors.ServerError)
+
 class LLMPatternAnalyzer:
     """Uses LLM to analyze raw patterns and extract semantic insights"""
     
@@ -37,16 +47,23 @@ class LLMPatternAnalyzer:
         self.client = Client(api_key=api_key)
         self.model = model
         self.memory_db = MemoryDatabase.get_instance()
+        
+        # Circuit breaker state
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
     
     async def analyze_patterns(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze patterns using Gemini to extract memory modifications"""
 
+        # Fail fast while Gemini is unreachable instead of waiting out the timeout on every tool call
+        if time.monotonic() < self._circuit_open_until:
+            return {"success": False, "error": "Pattern analysis temporarily unavailable after repeated failures"}
+        
         # Create analysis prompt with system instructions
         prompt, response_schema, system_instruction = create_analysis_prompt(analysis_data)
         
+        print("Calling Gemini for analysis...")
         try:
-            print("Calling Gemini for analysis...")
-
             response = await asyncio.wait_for(
                 self.client.aio.models.generate_content(
                     model=self.model,
@@ -60,7 +77,17 @@ class LLMPatternAnalyzer:
                 ),
                 timeout=30.0
             )
-            
+        except UNAVAILABLE_ERRORS as e:
+            print(f"[PATTERN ANALYZER ERROR] {str(e)}")
+            self._record_call_failure()
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            print(f"[PATTERN ANALYZER ERROR] {str(e)}")
+            return {"success": False, "error": str(e)}
+        
+        self._consecutive_failures = 0
+        
+        try:
             # Print the Gemini response text with error handling
             try:
                 print(f"[GEMINI RESPONSE] {response.text if response else 'None'}")
@@ -85,4 +112,11 @@ class LLMPatternAnalyzer:
             
         except Exception as e:
             print(f"[PATTERN ANALYZER ERROR] {str(e)}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
+    
+    def _record_call_failure(self):
+        """Count a failed Gemini call and open the circuit breaker at the threshold"""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + FAILURE_COOLDOWN_SECONDS
+            print(f"[PATTERN ANALYZER] Pausing analysis for {FAILURE_COOLDOWN_SECONDS:.0f}s after {self._consecutive_failures} consecutive failures")
\ No newline at end of file
@@ -26,13 +26,38 @@ class PatternRecognizer:
         
         # Track last analysis to avoid over-processing
         self.last_analysis_timestamp = None
+        
+        # Analyses run one at a time; at most one more waits, since it will read every execution logged meanwhile
+        self._analysis_lock = asyncio.Lock()
+        self._analysis_waiting = False
     
     async def recognize_patterns_async(self, trigger_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Asynchronously recognize patterns from tool execution data
         """
+        if self._analysis_waiting:
+            return {
+                "skipped": True,
+                "reason": "Pattern analysis already queued"
+            }
+        
+        self._analysis_waiting = True
+        try:
+            await self._analysis_lock.acquire()
+        finally:
+            self._analysis_waiting = False
+        
+        try:
+            return await self._recognize_patterns(trigger_context)
+        finally:
+            self._analysis_lock.release()
+    
+    async def _recognize_patterns(self, trigger_context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run a single pattern analysis pass over recent tool executions and stored memories"""
+        # Database calls are blocking SQLite I/O, so they run in worker threads
+        # to keep the live audio stream responsive while analysis runs.
         # Get total tool executions count to determine if we should run analysis
-        total_tool_count = len(self.memory_db.get_tool_executions(limit=1000))
+        total_tool_count = len(await asyncio.to_thread(self.memory_db.get_tool_executions, limit=1000))
         
         # In development: run on every tool call
         # In production: run every 10 tool calls
@@ -50,11 +75,12 @@ class PatternRecognizer:
                 "total_tool_count": total_tool_count
             }
         
-        # Get ALL tool executions for comprehensive analysis
-        all_tool_executions = self.memory_db.get_tool_executions(limit=100)
-        
-        # Get ALL stored memories for context
-        stored_memories = self.memory_db.get_memories(min_confidence=0.0)
+        # Get ALL tool executions for comprehensive analysis and ALL stored memories for context
+        # (independent reads, so they run concurrently)
+        all_tool_executions, stored_memories = await asyncio.gather(
+            asyncio.to_thread(self.memory_db.get_tool_executions, limit=100),
+            asyncio.to_thread(self.memory_db.get_memories, min_confidence=0.0)
+        )
         
         # Log what we're analyzing (required log #2)
         print(f"[RELEVANT TOOLS] ALL (Total: {len(all_tool_executions)} executions)")
@@ -108,7 +134,7 @@ class PatternRecognizer:
         
         # Clean up low-confidence memories
         cleanup_threshold = 0.1
-        deleted_count = self.memory_db.cleanup_low_confidence_memories(cleanup_threshold)
+        deleted_count = await asyncio.to_thread(self.memory_db.cleanup_low_confidence_memories, cleanup_threshold)
         
         # Update last analysis timestamp
         self.last_analysis_timestamp = datetime.now().isoformat()
@@ -139,7 +165,7 @@ class PatternRecognizer:
                 memory_text = mod.get("memory")
                 
                 if action == "create" and memory_text:
-                    new_id = self.memory_db.add_memory(memory_text, confidence=0.5)
+                    new_id = await asyncio.to_thread(self.memory_db.add_memory, memory_text, confidence=0.5)
                     saved_insights.append({
                         "action": "created",
                         "id": new_id,
@@ -147,7 +173,7 @@ class PatternRecognizer:
                     })
                 
                 elif action == "reinforce" and memory_id:
-                    success = self.memory_db.reinforce_memory(memory_id)
+                    success = await asyncio.to_thread(self.memory_db.reinforce_memory, memory_id)
                     if success:
                         saved_insights.append({
                             "action": "reinforced",
@@ -157,7 +183,7 @@ class PatternRecognizer:
                         failed_saves.append({"action": action, "id": memory_id, "error": "Reinforce failed"})
                 
                 elif action == "weaken" and memory_id:
-                    result = self.memory_db.weaken_memory(memory_id)
+                    result = await asyncio.to_thread(self.memory_db.weaken_memory, memory_id)
                     if result == "deleted":
                         saved_insights.append({
                             "action": "deleted",
@@ -172,7 +198,7 @@ class PatternRecognizer:
                         failed_saves.append({"action": action, "id": memory_id, "error": "Weaken failed"})
                 
                 elif action == "update_content" and memory_id and memory_text:
-                    success = self.memory_db.update_memory_content(memory_id, memory_text)
+                    success = await asyncio.to_thread(self.memory_db.update_memory_content, memory_id, memory_text)
                     if success:
                         saved_insights.append({
                             "action": "updated",
@@ -200,7 +226,7 @@ class PatternRecognizer:
     async def get_relevant_insights(self) -> List[Dict[str, Any]]:
         """Retrieve relevant insights from memory using deterministic category filtering"""
         # Get all memories with learned_behaviors category
-        memories = self.memory_db.get_memories(min_confidence=0.3)
+        memories = await asyncio.to_thread(self.memory_db.get_memories, min_confidence=0.3)
         
         # Filter by category
         learned_behaviors = []
@@ -49,48 +49,8 @@ For example, if the user has told you before he always wanted to go Paris to vis
 Always use provided MCPs and functions. DO NOT attempt to generate your own code and execute it.
 """
 
-def create_analysis_prompt(analysis_data: Dict[str, Any]) -> Tuple[str, Dict[str, Any], str]:
-    """Create a structured prompt for comprehensive pattern analysis with system instructions"""
-    
-    tool_executions = analysis_data.get("tool_executions", [])
-    stored_memories = analysis_data.get("stored_memories", [])
-    
-    # Format tool executions for the prompt
-    tool_data = ""
-    if tool_executions:
-        tool_data = "RECENT TOOL EXECUTIONS:\n"
-        for i, execution in enumerate(tool_executions[:20], 1):  # Limit to most recent 20
-            tool_name = execution.get("tool", "unknown")
-            timestamp = execution.get("timestamp", "unknown")
-            arguments = execution.get("arguments", {})
-            context = execution.get("context", None)
-            context_str = f" | Context: {context}" if context else ""
-            tool_data += f"{i}. {tool_name} at {timestamp} with args: {arguments}{context_str}\n"
-    else:
-        tool_data = "No tool executions found.\n"
-    
-    # Format stored memories for the prompt
-    memory_context = ""
-    if stored_memories:
-        memory_context = "\nCURRENTLY STORED MEMORIES:\n"
-        for memory in stored_memories:
-            memory_id = memory.get("id", "unknown")
-            memory_text = memory.get("memory", "")
-            confidence = memory.get("confidence", 0.0)
-            memory_context += f"ID {memory_id} (confidence: {confidence:.2f}): {memory_text}\n"
-    else:
-        memory_context = "\nNo stored memories found.\n"
-    
-    # Simple prompt with just the data
-    prompt = f"""
-{tool_data}
-{memory_context}
-
-Analyze the tool execution data and stored memories to identify temporal patterns and user preferences. Return appropriate memory modifications based on the patterns you identify.
-"""
-    
-    # Comprehensive system instructions
-    system_instruction = """
+# Static system instructions for pattern analysis (built once at import)
+analysis_system_instruction = """
 You are analyzing user behavior patterns from tool usage data to identify TWO SPECIFIC TYPES of patterns:
 
 1. **TEMPORAL PATTERNS**: When the user tends to execute certain tools or actions
@@ -175,41 +135,78 @@ STRICT FORMATTING REQUIREMENTS:
 3. Focus ONLY on temporal patterns and user preferences/facts
 4. Ignore all other types of patterns
 """
-    
-    response_schema = {
-        "type": "OBJECT",
-        "properties": {
-            "memory_modifications": {
-                "type": "ARRAY",
-                "items": {
-                    "type": "OBJECT",
-                    "properties": {
-                        "action": {
-                            "type": "STRING",
-                            "enum": ["create", "reinforce", "weaken", "update_content"],
-                            "description": "Type of memory modification to perform"
-                        },
-                        "id": {
-                            "anyOf": [
-                                {"type": "INTEGER"},
-                                {"type": "NULL"}
-                            ],
-                            "description": "Memory ID for reinforce/weaken/update_content actions, null for create"
-                        },
-                        "memory": {
-                            "anyOf": [
-                                {"type": "STRING"},
-                                {"type": "NULL"}
-                            ],
-                            "description": "Memory text content for create/update_content actions, null for reinforce/weaken"
-                        }
+
+# Structured output schema for pattern analysis (built once at import)
+analysis_response_schema = {
+    "type": "OBJECT",
+    "properties": {
+        "memory_modifications": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "action": {
+                        "type": "STRING",
+                        "enum": ["create", "reinforce", "weaken", "update_content"],
+                        "description": "Type of memory modification to perform"
                     },
-                    "required": ["action", "id", "memory"]
+                    "id": {
+                        "type": "INTEGER",
+                        "nullable": True,
+                        "description": "Memory ID for reinforce/weaken/update_content actions, null for create"
+                    },
+                    "memory": {
+                        "type": "STRING",
+                        "nullable": True,
+                        "description": "Memory text content for create/update_content actions, null for reinforce/weaken"
+                    }
                 },
-                "description": "List of memory modifications to apply based on pattern analysis"
-            }
-        },
-        "required": ["memory_modifications"]
-    }
+                "required": ["action", "id", "memory"]
+            },
+            "description": "List of memory modifications to apply based on pattern analysis"
+        }
+    },
+    "required": ["memory_modifications"]
+}
+
+def create_analysis_prompt(analysis_data: Dict[str, Any]) -> Tuple[str, Dict[str, Any], str]:
+    """Create a structured prompt for comprehensive pattern analysis with system instructions"""
+    
+    tool_executions = analysis_data.get("tool_executions", [])
+    stored_memories = analysis_data.get("stored_memories", [])
+    
+    # Format tool executions for the prompt
+    if tool_executions:
+        tool_lines = ["RECENT TOOL EXECUTIONS:"]
+        for i, execution in enumerate(tool_executions[:20], 1):  # Limit to most recent 20
+            tool_name = execution.get("tool", "unknown")
+            timestamp = execution.get("timestamp", "unknown")
+            arguments = execution.get("arguments", {})
+            context = execution.get("context", None)
+            context_str = f" | Context: {context}" if context else ""
+            tool_lines.append(f"{i}. {tool_name} at {timestamp} with args: {arguments}{context_str}")
+        tool_data = "\n".join(tool_lines) + "\n"
+    else:
+        tool_data = "No tool executions found.\n"
+    
+    # Format stored memories for the prompt (joined once rather than concatenated per memory)
+    if stored_memories:
+        memory_lines = ["\nCURRENTLY STORED MEMORIES:"]
+        for memory in stored_memories:
+            memory_id = memory.get("id", "unknown")
+            memory_text = memory.get("memory", "")
+            confidence = memory.get("confidence", 0.0)
+            memory_lines.append(f"ID {memory_id} (confidence: {confidence:.2f}): {memory_text}")
+        memory_context = "\n".join(memory_lines) + "\n"
+    else:
+        memory_context = "\nNo stored memories found.\n"
+    
+    # Simple prompt with just the data
+    prompt = f"""
+{tool_data}
+{memory_context}
+
+Analyze the tool execution data and stored memories to identify temporal patterns and user preferences. Return appropriate memory modifications based on the patterns you identify.
+"""
     
-    return prompt, response_schema, system_instruction
+    return prompt, analysis_response_schema, analysis_system_instruction
@@ -1,6 +1,8 @@
 """
 AgentRunner - Handles all agent-related operations and ADK session management
 """
+import asyncio
+import base64
 from typing import Tuple, Callable
 from pathlib import Path
 
@@ -15,11 +17,42 @@ from google.genai import types
 from ..agent import get_agent_async
 
 # Import workspace system initialization
-from ..tools.workspaces import initialize_workspace_system
+from ..tools.workspaces import initialize_workspace_system_in_background
 
 # Application constants
 APP_NAME = "LUNA"
 
+# Static event classifications, shared instead of rebuilt for every event
+CLOSE_CONNECTION_RESULT = {
+    "type": "close_connection",
+    "log_message": "TURN_COMPLETE - CLOSING_CONNECTION",
+    "websocket_message": {
+        "status": "close_connection",
+    }
+}
+TURN_COMPLETE_RESULT = {
+    "type": "status",
+    "log_message": "TURN_COMPLETE",
+    "websocket_message": {
+        "status": "turn_complete"
+    }
+}
+INTERRUPTED_RESULT = {
+    "type": "status",
+    "log_message": "INTERRUPTED",
+    "websocket_message": {
+        "status": "interrupted"
+    }
+}
+FINAL_RESPONSE_RESULT = {
+    "type": "log_only",
+    "log_message": "FINAL_RESPONSE"
+}
+GENERAL_EVENT_RESULT = {
+    "type": "general",
+    "log_message": "GENERAL_EVENT"
+}
+
 class AgentRunner:
     """
     Handles agent creation, session management, and ADK event processing.
@@ -34,8 +67,11 @@ class AgentRunner:
         self.current_session = None
         self.root_agent = None
         self.runner = None
+        # Guards agent creation so prewarm() and the first conversation don't both build it
+        self._agent_lock = asyncio.Lock()
         
-        self.live_request_queue = LiveRequestQueue()
+        # Created per conversation in start_conversation(); a closed queue can't be reused
+        self.live_request_queue = None
         # Set response modality (AUDIO for Luna) - matching old commit pattern
         modality = [types.Modality.AUDIO]
         self.runConfig = RunConfig(
@@ -58,55 +94,95 @@ class AgentRunner:
         # Flag to track when end_conversation_session tool has been called
         self.pendingClose = False
 
+        # Build the program index in the background; workspace searches wait for it if it is not ready yet
         self.log_info("[AGENT] Initializing workspace system...")
-        initialize_workspace_system()
+        initialize_workspace_system_in_background()
     
     async def _initialize(self):
-        """Async initialization - call this after creating AgentRunner instance"""
-        # Initialize workspace system for program searching
-        
-        self.current_session = await self.session_service.create_session(
+        """Async initialization - creates this conversation's session and returns it"""
+        # Kept local until returned: another connection may start a conversation while this one awaits
+        session = await self.session_service.create_session(
             app_name=APP_NAME,
             user_id="default",
             state={}
         )
 
-        self.root_agent = await get_agent_async()
+        await self._ensure_runner()
 
-        self.runner = Runner(
-            app_name=APP_NAME,
-            agent=self.root_agent,
-            session_service=self.session_service,
-            artifact_service=self.artifact_service
-        )
+        self.current_session = session
+        self.pendingClose = False
+        return session
+
+    async def _ensure_runner(self):
+        """Create the agent and runner once; they are reused across conversations"""
+        async with self._agent_lock:
+            if self.runner is not None:
+                return
+
+            self.root_agent = await get_agent_async()
+
+            self.runner = Runner(
+                app_name=APP_NAME,
+                agent=self.root_agent,
+                session_service=self.session_service,
+                artifact_service=self.artifact_service
+            )
+
+    async def prewarm(self):
+        """Build the agent ahead of the first conversation so the first connection doesn't wait for it"""
+        try:
+            await self._ensure_runner()
+            self.log_info("[AGENT] Agent prewarmed")
+        except Exception as e:
+            # The first conversation retries agent creation
+            self.log_error(f"[AGENT] Prewarm failed: {e}")
 
     async def start_conversation(self) -> Tuple:
         """
-        Begins a conversation and returns (live_events, live_request_queue)
+        Begins a conversation and returns (live_events, live_request_queue, session)
         """
         self.log_info("[AGENT] Starting conversation session")
 
-        await self._initialize()
+        session = await self._initialize()
 
-        self.log_info(f"[AGENT] Created session {self.current_session.id} for user default")
+        self.log_info(f"[AGENT] Created session {session.id} for user default")
+        
+        live_request_queue = LiveRequestQueue()
+        self.live_request_queue = live_request_queue
         
         live_events = self.runner.run_live(
             user_id="default",
-            session_id=self.current_session.id,
-            live_request_queue=self.live_request_queue,
+            session_id=session.id,
+            live_request_queue=live_request_queue,
             run_config=self.runConfig,
         )
 
-        return live_events, self.live_request_queue
+        return live_events, live_request_queue, session
     
-    async def end_conversation(self):
+    async def end_conversation(self, session, live_request_queue: LiveRequestQueue = None):
         """
-        Ends the current conversation and cleans up resources.
+        Ends the given conversation and cleans up its resources. Safe to call more than once per conversation.
         """
+        # Only reset shared state that still belongs to this conversation; a newer one may have started since
+        if self.current_session is session:
+            self.current_session = None
+            self.pendingClose = False
+
+        if self.live_request_queue is live_request_queue:
+            self.live_request_queue = None
+
+        # Close this conversation's queue so the live stream to the model ends
+        if live_request_queue is not None:
+            live_request_queue.close()
+
+        if session is None:
+            return
+
+        # Deleting an already deleted session is a no-op in the session service
         await self.session_service.delete_session(
             app_name=APP_NAME,
             user_id="default",
-            session_id=self.current_session.id
+            session_id=session.id
         )
     
     async def process_events(self, live_events, message_sender: Callable) -> None:
@@ -145,49 +221,33 @@ class AgentRunner:
         """
         Classify event type and handle all processing logic, returning structured data for process_events
         """
-        if (hasattr(event, 'turn_complete') and event.turn_complete):
+        # getattr with a default is a single lookup, where hasattr + attribute access is two
+        if getattr(event, 'turn_complete', None):
             if self.pendingClose:
-                return {
-                    "type": "close_connection",
-                    "log_message": "TURN_COMPLETE - CLOSING_CONNECTION",
-                    "websocket_message": {
-                        "status": "close_connection",
-                    }
-                }
+                return CLOSE_CONNECTION_RESULT
             else:
-                return {
-                    "type": "status",
-                    "log_message": "TURN_COMPLETE",
-                    "websocket_message": {
-                        "status": "turn_complete"
-                    }
-                }
+                return TURN_COMPLETE_RESULT
         
-        if hasattr(event, 'interrupted') and event.interrupted:
+        if getattr(event, 'interrupted', None):
             if self.pendingClose:
                 self.pendingClose = False # In case user wants to make an additional request.
             
-            return {
-                    "type": "status",
-                    "log_message": "INTERRUPTED",
-                    "websocket_message": {
-                        "status": "interrupted"
-                    }
-                }
+            return INTERRUPTED_RESULT
         
         # Handle error events (ADK uses error_code and error_message)
-        if (hasattr(event, 'error_code') and event.error_code) or (hasattr(event, 'error_message') and event.error_message):
-            error_code = getattr(event, 'error_code', 'unknown')
-            error_message = getattr(event, 'error_message', 'no message')[:50]
+        error_code = getattr(event, 'error_code', None)
+        error_message = getattr(event, 'error_message', None)
+        if error_code or error_message:
             return {
                 "type": "log_only",
-                "log_message": f"ERROR: {error_code} - {error_message}"
+                "log_message": f"ERROR: {error_code or 'unknown'} - {(error_message or 'no message')[:50]}"
             }
         
         # Handle function calls (tool requests)
-        if hasattr(event, 'get_function_calls') and event.get_function_calls():
+        get_function_calls = getattr(event, 'get_function_calls', None)
+        function_calls = get_function_calls() if get_function_calls else None
+        if function_calls:
             try:
-                function_calls = event.get_function_calls()
                 call_names = [call.name for call in function_calls if hasattr(call, 'name')]
                 
                 return {
@@ -198,9 +258,10 @@ class AgentRunner:
                 pass
         
         # Handle function responses (tool results)
-        if hasattr(event, 'get_function_responses'):
+        get_function_responses = getattr(event, 'get_function_responses', None)
+        if get_function_responses:
             try:
-                function_responses = event.get_function_responses()
+                function_responses = get_function_responses()
                 if function_responses:
                     response_names = [resp.name for resp in function_responses if hasattr(resp, 'name')]
                     
@@ -219,37 +280,41 @@ class AgentRunner:
             except:
                 pass
         
+        content = getattr(event, 'content', None)
+        parts = getattr(content, 'parts', None) if content else None
+        
         # Handle code execution events (executable_code and code_execution_result)
-        if hasattr(event, 'content') and event.content and hasattr(event.content, 'parts') and event.content.parts:
-            for part in event.content.parts:
+        if parts:
+            for part in parts:
                 # Handle executable code generation
-                if hasattr(part, 'executable_code') and part.executable_code:
-                    code_snippet = getattr(part.executable_code, 'code', 'N/A')[:100]  # First 100 chars
+                executable_code = getattr(part, 'executable_code', None)
+                if executable_code:
+                    code_snippet = getattr(executable_code, 'code', 'N/A')[:100]  # First 100 chars
                     return {
                         "type": "log_only",
                         "log_message": f"CODE_GENERATED: {code_snippet}..."
                     }
                 
                 # Handle code execution results
-                if hasattr(part, 'code_execution_result') and part.code_execution_result:
-                    outcome = getattr(part.code_execution_result, 'outcome', 'unknown')
-                    output = str(getattr(part.code_execution_result, 'output', ''))  # First 50 chars
+                code_execution_result = getattr(part, 'code_execution_result', None)
+                if code_execution_result:
+                    outcome = getattr(code_execution_result, 'outcome', 'unknown')
+                    output = str(getattr(code_execution_result, 'output', ''))  # First 50 chars
                     return {
                         "type": "log_only",
                         "log_message": f"CODE_RESULT: {outcome} - {output}..."
                     }
         
         # Handle audio content (main content type for AUDIO modality)
-        if hasattr(event, 'content') and event.content and hasattr(event.content, 'parts') and event.content.parts:
-            first_part = event.content.parts[0]
-            if hasattr(first_part, 'inline_data') and first_part.inline_data:
-                mime_type = getattr(first_part.inline_data, 'mime_type', 'unknown')
-                data_size = len(getattr(first_part.inline_data, 'data', b''))
+        if parts:
+            inline_data = getattr(parts[0], 'inline_data', None)
+            if inline_data:
+                mime_type = getattr(inline_data, 'mime_type', 'unknown')
+                data_size = len(getattr(inline_data, 'data', b''))
                 
                 # Process audio data for WebSocket transmission
                 try:
-                    audio_data = first_part.inline_data.data
-                    import base64
+                    audio_data = inline_data.data
                     return {
                         "type": "audio",
                         "log_message": f"AUDIO_CONTENT: {mime_type} ({data_size} bytes)",
@@ -266,15 +331,17 @@ class AgentRunner:
                     }
         
         # Handle actions (state/artifact updates)
-        if hasattr(event, 'actions') and event.actions:
+        event_actions = getattr(event, 'actions', None)
+        if event_actions:
             actions = []
-            if hasattr(event.actions, 'state_delta') and event.actions.state_delta:
+            if getattr(event_actions, 'state_delta', None):
                 actions.append("state_delta")
-            if hasattr(event.actions, 'artifact_delta') and event.actions.artifact_delta:
+            if getattr(event_actions, 'artifact_delta', None):
                 actions.append("artifact_delta")
-            if hasattr(event.actions, 'transfer_to_agent') and event.actions.transfer_to_agent:
-                actions.append(f"transfer_to_{event.actions.transfer_to_agent}")
-            if hasattr(event.actions, 'escalate') and event.actions.escalate:
+            transfer_to_agent = getattr(event_actions, 'transfer_to_agent', None)
+            if transfer_to_agent:
+                actions.append(f"transfer_to_{transfer_to_agent}")
+            if getattr(event_actions, 'escalate', None):
                 actions.append("escalate")
             if actions:
                 return {
@@ -283,17 +350,13 @@ class AgentRunner:
                 }
         
         # Handle final response indicator
-        if hasattr(event, 'is_final_response') and callable(event.is_final_response):
+        is_final_response = getattr(event, 'is_final_response', None)
+        if callable(is_final_response):
             try:
-                if event.is_final_response():
-                    return {
-                        "type": "log_only",
-                        "log_message": f"FINAL_RESPONSE"
-                    }
+                if is_final_response():
+                    return FINAL_RESPONSE_RESULT
             except:
                 pass
 
-        return {
-            "type": "general",
-            "log_message": f"GENERAL_EVENT: {event}",
-        }
\ No newline at end of file
+        # General events are not logged, so skip formatting the (potentially large) event repr
+        return GENERAL_EVENT_RESULT
\ No newline at end of file
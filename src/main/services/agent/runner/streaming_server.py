@@ -4,6 +4,7 @@ Handles configuration, logging setup, and component wiring
 """
 import os
 import sys
+import asyncio
 import logging
 import warnings
 from pathlib import Path
@@ -61,29 +62,52 @@ def configure_logging():
 
 configure_logging()
 
+def _create_logger() -> logging.Logger:
+    """Create the Luna logger: info to original stdout, errors to original stderr (both visible to Node.js)"""
+    logger = logging.getLogger("luna")
+    logger.propagate = False
+    
+    # An unknown level name would make setLevel raise and stop the server from starting
+    level_name = os.environ.get("LUNA_LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    
+    formatter = logging.Formatter("%(message)s")
+    
+    info_handler = logging.StreamHandler(original_stdout or sys.stdout)
+    info_handler.setFormatter(formatter)
+    info_handler.addFilter(lambda record: record.levelno < logging.ERROR)
+    
+    error_handler = logging.StreamHandler(original_stderr or sys.stderr)
+    error_handler.setFormatter(formatter)
+    error_handler.setLevel(logging.ERROR)
+    
+    logger.handlers = [info_handler, error_handler]
+    
+    if not isinstance(level, int):
+        logger.warning(f"[LOGGING] Unknown LUNA_LOG_LEVEL '{level_name}', using INFO")
+    return logger
+
+logger = _create_logger()
+
 def log_info(message: str):
     """Log info message to original stdout (visible to Node.js)"""
-    if original_stdout:
-        print(message, file=original_stdout, flush=True)
-    else:
-        print(message, file=sys.stdout, flush=True)
+    logger.info(message)
 
 def log_error(message: str):
     """Log error message to original stderr (visible to Node.js)"""
-    if original_stderr:
-        print(message, file=original_stderr, flush=True)
-    else:
-        print(message, file=sys.stderr, flush=True)
+    logger.error(message)
 
 from .agent_runner import AgentRunner
 from .websocket_server import WebSocketServer
 
-load_dotenv()
-
 PORT = 8765
 
 async def create_server():
     """Create and configure the server components"""
+    # Read .env when the server starts rather than on every import of this module
+    load_dotenv()
+    
     # Create AgentRunner instance with loggers in constructor
     agent_runner = AgentRunner(log_info, log_error)
     
@@ -95,8 +119,17 @@ async def create_server():
 async def start_streaming_server_async(host: str = "localhost", port: int = PORT):
     """Async method to start the server with minimal output"""
     streaming_server = await create_server()
-    await streaming_server.start_server(host, port)
+    # Build the agent while uvicorn starts up instead of on the first connection
+    await asyncio.gather(
+        streaming_server.agent_runner.prewarm(),
+        streaming_server.start_server(host, port)
+    )
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(start_streaming_server_async())
+    try:
+        # libuv-based event loop where available (uvloop does not support Windows)
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    run(start_streaming_server_async())
@@ -1,16 +1,23 @@
 """
 WebSocketServer - Handles FastAPI setup, WebSocket connections, and message routing
 """
-import json
 import asyncio
 import base64
 from typing import Callable
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 import uvicorn
+from pydantic import BaseModel, ValidationError
 
 from google.genai.types import Blob
 from google.adk.agents import LiveRequestQueue
 
+class ClientMessage(BaseModel):
+    """Inbound message from the Electron renderer"""
+    type: str = ""
+    mime_type: str = ""
+    data: str = ""
+
 class WebSocketServer:
     """Handles WebSocket connections and message routing"""
     
@@ -36,14 +43,16 @@ class WebSocketServer:
             await websocket.accept()
             self.current_websocket = websocket
             self.current_client_id = "luna"  # Fixed client ID since Luna is single-user
+            session = None
+            live_request_queue = None
             
             try:
-                live_events, live_request_queue = await self.agent_runner.start_conversation()
+                live_events, live_request_queue, session = await self.agent_runner.start_conversation()
                 
                 # Create message sender callback for the agent
                 async def message_sender(message: dict):
                     try:
-                        await websocket.send_text(json.dumps(message))
+                        await websocket.send_text(orjson.dumps(message).decode())
                     except Exception as e:
                         self.log_error(f"[WEBSOCKET] Send error: {e}")
                 
@@ -83,7 +92,7 @@ class WebSocketServer:
                 except Exception as e:
                     self.log_error(f"[WEBSOCKET] Error awaiting analysis: {e}")
                 
-                await self.agent_runner.end_conversation()
+                await self.agent_runner.end_conversation(session, live_request_queue)
                 self.current_websocket = None
                 self.current_client_id = None
                 self.log_info(f"[WEBSOCKET] Client luna cleanup completed")
@@ -98,11 +107,15 @@ class WebSocketServer:
         try:
             while True:
                 message_json = await websocket.receive_text()
-                message = json.loads(message_json)
+                try:
+                    message = ClientMessage.model_validate_json(message_json)
+                except ValidationError as e:
+                    self.log_error(f"[WEBSOCKET] Invalid message: {e.error_count()} validation error(s)")
+                    continue
                 
-                message_type = message.get("type", "")
-                mime_type = message.get("mime_type", "")
-                data = message.get("data", "")
+                message_type = message.type
+                mime_type = message.mime_type
+                data = message.data
                 
                 # Handle session control messages
                 if message_type == "stop_session":
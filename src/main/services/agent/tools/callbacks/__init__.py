@@ -13,6 +13,30 @@ except ImportError:
 # Global set to track active pattern analysis tasks
 _active_analysis_tasks: Set[asyncio.Task] = set()
 
+# Memory-related tools are skipped as they don't provide user behavioral insights
+_SKIP_TOOLS = frozenset({
+    "search_memory",
+    "save_memory",
+    "get_all_memories",
+    "modify_memory",
+    "delete_memory",
+    "end_conversation_session"
+})
+
+# Shared pattern recognizer, created on first use
+_pattern_recognizer = None
+
+def _get_pattern_recognizer():
+    """Get the shared PatternRecognizer so its LLM client is reused across tool calls"""
+    global _pattern_recognizer
+    
+    if _pattern_recognizer is None:
+        # Lazy import to avoid triggering google.genai import chain until needed
+        from ...memory.pattern_recognizer import PatternRecognizer
+        _pattern_recognizer = PatternRecognizer()
+    
+    return _pattern_recognizer
+
 def after_tool_callback(
     tool: BaseTool, 
     args: Dict[str, Any], 
@@ -21,17 +45,7 @@ def after_tool_callback(
 ) -> Optional[Dict]:
     """Simple after_tool_callback for logging tool executions and triggering pattern recognition"""
     
-    # Skip memory-related tools as they don't provide user behavioral insights
-    skip_tools = {
-        "search_memory",
-        "save_memory", 
-        "get_all_memories",
-        "modify_memory",
-        "delete_memory",
-        "end_conversation_session"
-    }
-    
-    if tool.name in skip_tools:
+    if tool.name in _SKIP_TOOLS:
         return None  # Skip logging and pattern analysis for memory tools
     
     # Log the tool execution with result for confidence scoring
@@ -54,11 +68,8 @@ def after_tool_callback(
     from datetime import datetime
     print(f"[ANALYZING] Tool: {tool.name} | Args: {args} | Time: {datetime.now().isoformat()}")
     
-    # Lazy import to avoid triggering google.genai import chain until needed
-    from ...memory.pattern_recognizer import PatternRecognizer
-    
     # Trigger pattern recognition (non-blocking)
-    pattern_recognizer = PatternRecognizer()
+    pattern_recognizer = _get_pattern_recognizer()
     trigger_context = {
         "trigger_type": "tool_execution",
         "last_tool": tool.name,
@@ -7,13 +7,10 @@ def get_documents_directory():
     """
     path = r"D:\Downloads"
 
-    print(path)
     return os.path.abspath(path)
 
 TARGET_FOLDER_PATH = get_documents_directory()
 
-print(TARGET_FOLDER_PATH)
-
 filesystem_mcp = MCPToolset(
     connection_params=StdioConnectionParams(
         server_params=StdioServerParameters(
@@ -1,11 +1,11 @@
 import os
 import platform
 import subprocess
-import json
+import orjson
 import webbrowser
-import sqlite3
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     # Try relative import first (for normal package usage)
@@ -19,7 +19,7 @@ from whoosh.index import create_in, open_dir, exists_in
 from whoosh.fields import Schema, TEXT, ID, STORED
 from whoosh.qparser import QueryParser
 from whoosh.query import And, Or, Term
-import tempfile
+from whoosh.writing import CLEAR
 import threading
 
 # Function to get singleton database instance
@@ -33,6 +33,10 @@ _index = None
 _index_lock = threading.Lock()
 _index_initialized = False
 
+# Resolved program lookups keyed by lowercase program name. The index only
+# changes when it is rebuilt, which clears this cache.
+_program_match_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
 def initialize_workspace_system():
     """Initialize Whoosh index for program searching - called at application start"""
     global _index_dir, _index, _index_initialized
@@ -40,31 +44,126 @@ def initialize_workspace_system():
     if _index_initialized:
         return  # Already initialized
     
-    try:
-        # Create temporary directory for index
-        _index_dir = tempfile.mkdtemp(prefix="luna_program_index_")
-        
-        # Define schema for program index
-        schema = Schema(
-            name=TEXT(stored=True),
-            path=ID(stored=True, unique=True),
-            display_name=TEXT(stored=True),
-            platform=STORED()
-        )
-        
-        # Create index
-        _index = create_in(_index_dir, schema)
+    # The index may be built on a background thread while a search waits for it
+    with _index_lock:
+        if _index_initialized:
+            return  # Initialized while waiting for the lock
         
-        # Build index based on current platform
+        refresh_stored_index = False
+        try:
+            # Keep the index next to the memory database so it survives restarts
+            project_root = Path(__file__).parents[5]  # Go up 5 levels
+            _index_dir = str(project_root / "assets" / "data" / "program_index")
+            os.makedirs(_index_dir, exist_ok=True)
+            
+            index_stamp = _get_index_stamp()
+            
+            _index = None
+            if exists_in(_index_dir) and _read_index_stamp() == index_stamp:
+                # No search root has changed since the last build
+                try:
+                    _index = open_dir(_index_dir)
+                    refresh_stored_index = True
+                except Exception as e:
+                    # Unreadable index (interrupted write, Whoosh upgrade) - rebuild it below
+                    print(f"Warning: Stored program index could not be opened, rebuilding: {e}")
+            
+            if _index is None:
+                # Drop the stamp first so an interrupted rebuild is never paired with a valid stamp
+                _get_index_stamp_path().unlink(missing_ok=True)
+                
+                # Define schema for program index
+                schema = Schema(
+                    name=TEXT(stored=True),
+                    path=ID(stored=True, unique=True),
+                    display_name=TEXT(stored=True),
+                    platform=STORED()
+                )
+                
+                # Create index
+                _index = create_in(_index_dir, schema)
+                
+                # Build index based on current platform
+                _build_program_index()
+                _write_index_stamp(index_stamp)
+            
+            _index_initialized = True
+            print("Luna: Workspace system initialized successfully")
+            
+        except Exception as e:
+            print(f"Warning: Failed to initialize workspace system: {e}")
+            _index = None
+            _index_initialized = False
+            return
+    
+    if refresh_stored_index:
+        # The stamp only sees top-level changes, so programs updated inside existing folders
+        # would keep stale paths; serve the stored index now and rescan in the background
+        threading.Thread(
+            target=_refresh_program_index,
+            args=(index_stamp,),
+            name="luna-program-index-refresh",
+            daemon=True
+        ).start()
+
+def initialize_workspace_system_in_background() -> threading.Thread:
+    """Build the program index on a background thread so startup is not blocked by the filesystem scan"""
+    thread = threading.Thread(target=initialize_workspace_system, name="luna-program-index", daemon=True)
+    thread.start()
+    return thread
+
+def _get_search_roots() -> List[Path]:
+    """Get the directories scanned for programs on the current platform"""
+    system = platform.system()
+    
+    if system == "Windows":
+        return _get_windows_search_paths()
+    elif system == "Darwin":  # macOS
+        return _get_macos_search_paths()
+    elif system == "Linux":
+        path_dirs = [Path(path_dir) for path_dir in os.environ.get('PATH', '').split(os.pathsep) if path_dir]
+        return path_dirs + _get_linux_search_paths()
+    return []
+
+def _get_index_stamp() -> Dict[str, Any]:
+    """Fingerprint the search roots by modification time - installing or removing a program changes it"""
+    roots = {}
+    for root in _get_search_roots():
+        try:
+            roots[str(root)] = root.stat().st_mtime_ns
+        except OSError:
+            continue
+    return {"platform": platform.system(), "roots": roots}
+
+def _get_index_stamp_path() -> Path:
+    """Get the path of the stamp file stored alongside the index"""
+    return Path(_index_dir) / "index_stamp.json"
+
+def _read_index_stamp() -> Optional[Dict[str, Any]]:
+    """Read the stamp of the last completed index build"""
+    try:
+        return orjson.loads(_get_index_stamp_path().read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _write_index_stamp(stamp: Dict[str, Any]):
+    """Record the stamp of a completed index build"""
+    # Write to a temporary file and swap it in so a crash never leaves a torn stamp
+    stamp_path = _get_index_stamp_path()
+    tmp_path = stamp_path.with_suffix('.tmp')
+    tmp_path.write_bytes(orjson.dumps(stamp))
+    os.replace(tmp_path, stamp_path)
+
+def _refresh_program_index(stamp: Dict[str, Any]):
+    """Rebuild the stored program index from a fresh scan"""
+    try:
+        # Drop the stamp first so an interrupted rebuild is never paired with a valid stamp
+        _get_index_stamp_path().unlink(missing_ok=True)
         _build_program_index()
-        
-        _index_initialized = True
-        print("Luna: Workspace system initialized successfully")
-        
+        _write_index_stamp(stamp)
+        print("Luna: Program index refreshed")
     except Exception as e:
-        print(f"Warning: Failed to initialize workspace system: {e}")
-        _index = None
-        _index_initialized = False
+        print(f"Warning: Failed to refresh program index: {e}")
 
 def _build_program_index():
     """Build the program index based on current platform"""
@@ -72,19 +171,27 @@ def _build_program_index():
     
     if not _index:
         return
-        
+    
     system = platform.system()
     
-    with _index.writer() as writer:
+    writer = _index.writer()
+    try:
         if system == "Windows":
             _index_windows_programs(writer)
         elif system == "Darwin":  # macOS
             _index_macos_programs(writer)
         elif system == "Linux":
             _index_linux_programs(writer)
+    except Exception:
+        writer.cancel()
+        raise
+    
+    # CLEAR replaces every previously indexed document, so a rebuild also drops stale paths
+    writer.commit(mergetype=CLEAR)
+    _program_match_cache.clear()
 
-def _index_windows_programs(writer):
-    """Index Windows programs"""
+def _get_windows_search_paths() -> List[Path]:
+    """Get Windows program directories"""
     search_paths = [
         Path(os.environ.get('PROGRAMFILES', 'C:\\Program Files')),
         Path(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')),
@@ -104,52 +211,67 @@ def _index_windows_programs(writer):
     
     # Add Start Menu paths to main search paths
     search_paths.extend(start_menu_paths)
+    return search_paths
+
+def _iter_windows_program_files(root: str):
+    """Recursively yield .exe and .lnk files under root in a single scandir walk"""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter_windows_program_files(entry.path)
+                    elif entry.name.lower().endswith(('.exe', '.lnk')) and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+    except (PermissionError, OSError):
+        # Skip directories we cannot read but keep walking the rest
+        return
+
+def _scan_windows_path(search_path: Path) -> List[Path]:
+    """Collect program files under one Windows search path"""
+    program_files = []
+    if not search_path.exists():
+        return program_files
+        
+    try:
+        # For system directories, only look for .exe files to avoid too many results
+        if 'System32' in str(search_path) or 'SysWOW64' in str(search_path):
+            for file_path in search_path.glob('*.exe'):
+                if file_path.is_file():
+                    program_files.append(file_path)
+        else:
+            # Search for .exe files and shortcuts in other directories
+            program_files.extend(_iter_windows_program_files(str(search_path)))
+    except (PermissionError, OSError):
+        pass
     
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
-            
-        try:
-            # For system directories, only look for .exe files to avoid too many results
-            if 'System32' in str(search_path) or 'SysWOW64' in str(search_path):
-                for file_path in search_path.glob('*.exe'):
-                    if file_path.is_file():
-                        writer.add_document(
-                            name=file_path.stem.lower(),
-                            path=str(file_path),
-                            display_name=file_path.stem,
-                            platform="Windows"
-                        )
-                        # Also index the full filename with extension for better matching
-                        writer.add_document(
-                            name=file_path.name.lower(),
-                            path=str(file_path),
-                            display_name=file_path.stem,
-                            platform="Windows"
-                        )
-            else:
-                # Search for .exe files and shortcuts in other directories
-                for ext in ['*.exe', '*.lnk']:
-                    for file_path in search_path.rglob(ext):
-                        if file_path.is_file():
-                            writer.add_document(
-                                name=file_path.stem.lower(),
-                                path=str(file_path),
-                                display_name=file_path.stem,
-                                platform="Windows"
-                            )
-                            # Also index the full filename with extension for better matching
-                            writer.add_document(
-                                name=file_path.name.lower(),
-                                path=str(file_path),
-                                display_name=file_path.stem,
-                                platform="Windows"
-                            )
-        except (PermissionError, OSError):
-            continue
+    return program_files
 
-def _index_macos_programs(writer):
-    """Index macOS programs"""
+def _index_windows_programs(writer):
+    """Index Windows programs"""
+    # Directory walks are I/O bound, so scan the search paths in parallel;
+    # the index writer is not thread-safe and stays on this thread
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for program_files in executor.map(_scan_windows_path, _get_windows_search_paths()):
+            for file_path in program_files:
+                writer.add_document(
+                    name=file_path.stem.lower(),
+                    path=str(file_path),
+                    display_name=file_path.stem,
+                    platform="Windows"
+                )
+                # Also index the full filename with extension for better matching
+                writer.add_document(
+                    name=file_path.name.lower(),
+                    path=str(file_path),
+                    display_name=file_path.stem,
+                    platform="Windows"
+                )
+
+def _get_macos_search_paths() -> List[Path]:
+    """Get macOS program directories"""
     search_paths = [
         Path('/Applications'),
         Path('/System/Applications'),
@@ -168,8 +290,11 @@ def _index_macos_programs(writer):
     
     # Add launcher paths to main search paths
     search_paths.extend(launcher_paths)
-    
-    for search_path in search_paths:
+    return search_paths
+
+def _index_macos_programs(writer):
+    """Index macOS programs"""
+    for search_path in _get_macos_search_paths():
         if not search_path.exists():
             continue
             
@@ -209,6 +334,27 @@ def _index_macos_programs(writer):
         except (PermissionError, OSError):
             continue
 
+def _get_linux_search_paths() -> List[Path]:
+    """Get Linux launcher directories"""
+    search_paths = [
+        Path('/usr/share/applications'),  # System-wide applications
+        Path(os.path.expanduser('~/.local/share/applications')),  # User applications
+        Path('/var/lib/snapd/desktop/applications'),  # Snap applications
+        Path('/var/lib/flatpak/exports/share/applications'),  # Flatpak applications
+        Path(os.path.expanduser('~/.local/share/flatpak/exports/share/applications')),  # User Flatpak
+    ]
+    
+    # Additional launcher directories
+    additional_paths = [
+        Path(os.path.expanduser('~/Desktop')),  # Desktop files
+        Path('/usr/local/share/applications'),  # Local applications
+        Path('/opt'),  # Optional software packages
+    ]
+    
+    # Add additional paths to main search paths
+    search_paths.extend(additional_paths)
+    return search_paths
+
 def _index_linux_programs(writer):
     """Index Linux programs"""
     # Search in PATH
@@ -232,25 +378,7 @@ def _index_linux_programs(writer):
             continue
     
     # Search .desktop files (application launchers)
-    search_paths = [
-        Path('/usr/share/applications'),  # System-wide applications
-        Path(os.path.expanduser('~/.local/share/applications')),  # User applications
-        Path('/var/lib/snapd/desktop/applications'),  # Snap applications
-        Path('/var/lib/flatpak/exports/share/applications'),  # Flatpak applications
-        Path(os.path.expanduser('~/.local/share/flatpak/exports/share/applications')),  # User Flatpak
-    ]
-    
-    # Additional launcher directories
-    additional_paths = [
-        Path(os.path.expanduser('~/Desktop')),  # Desktop files
-        Path('/usr/local/share/applications'),  # Local applications
-        Path('/opt'),  # Optional software packages
-    ]
-    
-    # Add additional paths to main search paths
-    search_paths.extend(additional_paths)
-    
-    for search_path in search_paths:
+    for search_path in _get_linux_search_paths():
         if not search_path.exists():
             continue
             
@@ -322,6 +450,13 @@ def _search_programs_with_whoosh(program_names: List[str]) -> List[Dict[str, str
         for program_name in program_names:
             query_text = program_name.lower()
             
+            # Reuse a previous lookup for the same program
+            if query_text in _program_match_cache:
+                cached_match = _program_match_cache[query_text]
+                if cached_match:
+                    found_programs.append({**cached_match, 'name': program_name})
+                continue
+            
             # Get all possible search terms (original + aliases)
             search_terms = [query_text]
             if query_text in program_aliases:
@@ -367,6 +502,9 @@ def _search_programs_with_whoosh(program_names: List[str]) -> List[Dict[str, str
             
             if best_match and best_score > 0.2:  # Lower minimum threshold
                 found_programs.append(best_match)
+                _program_match_cache[query_text] = best_match
+            else:
+                _program_match_cache[query_text] = None
     
     return found_programs
 
@@ -807,7 +945,7 @@ def clear_all_workspaces() -> Dict[str, Any]:
         count_before = len(workspaces)
         
         # Clear all workspace data
-        with sqlite3.connect(db.db_path) as conn:
+        with db.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM workspaces")
             cursor.execute("DELETE FROM sqlite_sequence WHERE name='workspaces'")